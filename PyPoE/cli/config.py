@@ -48,6 +48,7 @@ See PyPoE/LICENSE
 # Python
 import sys
 from collections.abc import Iterable
+from functools import cached_property
 from typing import Any, Callable
 
 # 3rd party
@@ -65,6 +66,11 @@ from PyPoE.shared.config.validator import functions
 
 __all__ = ['ConfigError', 'SetupError', 'ConfigHelper']
 
+_MISSING = object()
+
+# Immutable types for which validated results of get_option can be cached
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
 # =============================================================================
 # Exceptions
 # =============================================================================
@@ -95,20 +101,48 @@ class ConfigHelper(ConfigObj):
     def __init__(self, infile: str) -> None:
         ConfigObj.__init__(self, infile=infile, raise_errors=True, configspec=ConfigObj())
 
+        configspec = self.configspec
+        if configspec is None:
+            raise TypeError("configspec is None")
+
         # Fix missing main sections
-        for item in ['Config', 'Setup']:
+        for item in ('Config', 'Setup'):
             if item not in self:
-                self.update({item: {}})
-            
-            if self.configspec is None:
-                raise TypeError("configspec is None")
-            if item not in self.configspec:
-                self.configspec.update({item: {}})
-
-        self.validator = Validator()
-        self.validator.functions.update(functions)
+                self[item] = {}
+            if item not in configspec:
+                configspec[item] = {}
+
+        # The main sections are never reassigned, so resolve them only once
+        self._opt = self._get_section(self, 'Config')
+        self._setup = self._get_section(self, 'Setup')
+        self._optspec = self._get_section(configspec, 'Config')
+        self._setupspec = self._get_section(configspec, 'Setup')
+
+        self._dirty = False
+        self._check_cache: dict[str, tuple[Any, Any]] = {}
         self._listeners: dict[str, list[Callable[[Any, Any, Any], Any]]] = {}
-        self.setupFunctions: dict[str, Iterable[Callable[[Any], Any]]] = {} 
+        self.setupFunctions: dict[str, tuple[Callable[[Any], Any], ...]] = {}
+
+    @cached_property
+    def validator(self) -> Validator:
+        """
+        Returns the validator used for the config, created on first access.
+
+        Returns
+        -------
+        validate.Validator
+        """
+        validator = Validator()
+        validator.functions.update(functions)
+        return validator
+
+    @staticmethod
+    def _get_section(parent: configobj.Section, key: str) -> configobj.Section:
+        section = parent[key] # type: ignore
+        if not isinstance(section, configobj.Section):
+            raise TypeError(f"{key} section is not of type configobj.Section")
+
+        return section
 
     @property
     def option(self) -> configobj.Section:
@@ -119,11 +153,7 @@ class ConfigHelper(ConfigObj):
         -------
         configobj.Section
         """
-        config = self['Config'] # type: ignore
-        if not isinstance(config, configobj.Section):
-            raise TypeError("config option section is not of type configobj.Section")
-
-        return config
+        return self._opt
 
     @property
     def optionspec(self) -> configobj.Section:
@@ -134,15 +164,7 @@ class ConfigHelper(ConfigObj):
         -------
         configobj.Section
         """
-        configspec = self.configspec
-        if configspec is None:
-            raise TypeError("configspec is None")
-        
-        config = configspec['Config'] # type: ignore
-        if not isinstance(config, configobj.Section):
-            raise TypeError("config option specification section is not of type configobj.Section")
-
-        return config
+        return self._optspec
 
     @property
     def setup(self) -> configobj.Section:
@@ -153,11 +175,7 @@ class ConfigHelper(ConfigObj):
         -------
         configobj.Section
         """
-        config = self['Setup'] # type: ignore
-        if not isinstance(config, configobj.Section):
-            raise TypeError("config setup section is not of type configobj.Section")
-
-        return config
+        return self._setup
 
     @property
     def setupspec(self) -> configobj.Section:
@@ -168,15 +186,29 @@ class ConfigHelper(ConfigObj):
         -------
         configobj.Section
         """
-        configspec = self.configspec
-        if configspec is None:
-            raise TypeError("configspec is None")
-        
-        config = configspec['Setup'] # type: ignore
-        if not isinstance(config, configobj.Section):
-            raise TypeError("config setup specification section is not of type configobj.Section")
+        return self._setupspec
 
-        return config
+    @property
+    def dirty(self) -> bool:
+        """
+        Returns whether any option or setup variable was changed since the
+        config was loaded or last written.
+
+        Returns
+        -------
+        bool
+        """
+        return self._dirty
+
+    def write(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Writes the config and resets the :attr:`dirty` flag.
+
+        See :meth:`configobj.ConfigObj.write` for the parameters.
+        """
+        result = ConfigObj.write(self, *args, **kwargs)
+        self._dirty = False
+        return result
 
     def add_option(self, key: str, specification: str) -> None:
         """
@@ -195,9 +227,10 @@ class ConfigHelper(ConfigObj):
         KeyError
             if the key is a duplicate
         """
-        if key in self.optionspec:
+        key = sys.intern(key)
+        if key in self._optspec:
             raise KeyError('Duplicate key: %s' % key)
-        self.optionspec[key] = specification
+        self._optspec[key] = specification
 
     def get_option(self, key: str, safe: bool=True) -> Any:
         """
@@ -229,15 +262,16 @@ class ConfigHelper(ConfigObj):
         SetupError
             if the setup for the key was not performed
         """
-        if safe and key in self.setup:
-            section = self.setup[key] # type: ignore
-            if not isinstance(section, configobj.Section):
-                raise TypeError(f"setup[{key}] section is not of type configobj.Section")
-            if not section['performed']:
-                raise SetupError('Setup not performed.')
-        try:
-            value = self.option[key]
-        except KeyError:
+        if safe:
+            section = self._setup.get(key)
+            if section is not None:
+                if not isinstance(section, configobj.Section):
+                    raise TypeError(f"setup[{key}] section is not of type configobj.Section")
+                if not section['performed']:
+                    raise SetupError('Setup not performed.')
+
+        value = self._opt.get(key, _MISSING)
+        if value is _MISSING:
             console(
                 'Config variable "%s" is not configured. Consider running:' %
                 key, msg=Msg.error)
@@ -245,17 +279,34 @@ class ConfigHelper(ConfigObj):
             console('Exiting...', msg=Msg.error)
             sys.exit(-1)
 
-        return self.validator.check(self.optionspec[key], value)
+        if type(value) not in _CACHEABLE_TYPES:
+            return self.validator.check(self._optspec[key], value)
+
+        # Validator.check copies the parsed spec and converts the value on each
+        # call, so reuse the result for as long as the raw value is unchanged
+        cached = self._check_cache.get(key)
+        if cached is not None and type(cached[0]) is type(value) and \
+                cached[0] == value:
+            return cached[1]
+
+        checked = self.validator.check(self._optspec[key], value)
+        # Mutable results (e.g. lists) must not be shared between callers
+        if type(checked) in _CACHEABLE_TYPES:
+            self._check_cache[key] = (value, checked)
+        return checked
 
     def set_option(self, key: str, value: Any) -> None:
         """
         Sets the key to the specified value.
 
         The function will also take care of the following:
-        - invalidate setups registered for this key, if any
         - validate the value
+        - invalidate setups registered for this key, if any
         - execute listeners
 
+        If the key has no setup registered and the validated value equals the
+        current (explicitly configured) value, nothing is changed.
+
         Parameters
         ----------
         key : str
@@ -267,20 +318,31 @@ class ConfigHelper(ConfigObj):
         validate.ValidationError
             if the validation of the value failed
         """
-        if key in self.setup:
-            section = self.setup[key] # type: ignore
+        # Raise ValidationError
+        value = self.validator.check(self._optspec[key], value)
+
+        option = self._opt
+        old_value = option.get(key)
+        section = self._setup.get(key)
+        if section is None:
+            # Nothing to invalidate or notify if the value is unchanged. Values
+            # that were only filled in as default still need to be stored
+            if key in option and key not in option.defaults and \
+                    old_value == value:
+                return
+        else:
             if not isinstance(section, configobj.Section):
                 raise TypeError(f"setup[{key}] section is not of type configobj.Section")
             section['performed'] = False
 
-        # Raise ValidationError
-        value = self.validator.check(self.optionspec[key], value)
-
-        if key in self._listeners:
-            for f in self._listeners[key]:
-                f(key, value, self.option[key])
+        listeners = self._listeners.get(key)
+        if listeners is not None:
+            for f in listeners:
+                f(key, value, old_value)
 
-        self.option[key] = value
+        option[key] = value
+        self._check_cache.pop(key, None)
+        self._dirty = True
 
     def register_setup(self, key: str, funcs: Callable[[Any], Any] | Iterable[Callable[[Any], Any]]) -> None:
         """
@@ -307,29 +369,56 @@ class ConfigHelper(ConfigObj):
             if funcs is not callable
 
         """
-        if key not in self.setup:
-            self.setup.update({
-                key: {
-                    'performed': False,
-                },
-            })
+        self.register_setups(((key, funcs), ))
+
+    def register_setups(self, items: Iterable[tuple[str, Callable[[Any], Any] | Iterable[Callable[[Any], Any]]]]) -> None:
+        """
+        Registers the setup functions for multiple config keys at once.
+
+        Works like :meth:`register_setup`, but updates the setup sections only
+        once for all keys.
+
+        Parameters
+        ----------
+        items : Iterable[tuple[str, callable or Iterable[callable]]]
+            pairs of config key and the function(s) to register for it
+
+        Raises
+        ------
+        TypeError
+            if any of the funcs is not callable
+        """
+        setup_functions = {
+            sys.intern(key): self._get_setup_functions(funcs)
+            for key, funcs in items
+        }
 
-        self.setupspec.update({
+        self._setup.update({
+            key: {
+                'performed': False,
+            } for key in setup_functions if key not in self._setup
+        })
+
+        self._setupspec.update({
             key: {
                 'performed': 'boolean()',
-            },
+            } for key in setup_functions
         })
 
-        if isinstance(funcs, Iterable):
-           for f in funcs:
-               if not callable(f):
-                   raise TypeError('Callable expected.')
-        elif not callable(funcs):
-            raise TypeError('Callabe expected.')
+        self.setupFunctions.update(setup_functions)
+
+    def _get_setup_functions(self, funcs: Callable[[Any], Any] | Iterable[Callable[[Any], Any]]) -> tuple[Callable[[Any], Any], ...]:
+        # Check callable first, callable objects may be iterable as well
+        if callable(funcs):
+            return (funcs, )
+        elif isinstance(funcs, Iterable):
+            funcs_tuple = tuple(funcs)
+            for f in funcs_tuple:
+                if not callable(f):
+                    raise TypeError('Callable expected.')
+            return funcs_tuple
         else:
-            funcs = (funcs, )
-
-        self.setupFunctions[key] = funcs
+            raise TypeError('Callable expected.')
 
     def add_setup_listener(self, config_key: str, function: Callable[[Any, Any, Any], Any]) -> None:
         """
@@ -356,10 +445,7 @@ class ConfigHelper(ConfigObj):
         if not callable(function):
              raise TypeError('Callabe expected.')
 
-        if config_key in self._listeners:
-            self._listeners[config_key].append(function)
-        else:
-            self._listeners[config_key] = [function, ]
+        self._listeners.setdefault(config_key, []).append(function)
 
     def add_setup_variable(self, setup_key: str, variable_key: str, specification: str) -> None:
         """
@@ -385,15 +471,15 @@ class ConfigHelper(ConfigObj):
             if the variable key is a duplicate
 
         """
-        if setup_key not in self.setupspec:
+        variable_key = sys.intern(variable_key)
+        section = self._setupspec.get(setup_key)
+        if section is None:
             raise KeyError('Setup key "%s" is invalid' % setup_key)
-        if variable_key in self.setupspec[setup_key]:
-            raise KeyError('Duplicate key: %s' % variable_key)
-        
-        section = self.setupspec[setup_key] # type: ignore
         if not isinstance(section, configobj.Section):
             raise TypeError(f"setupspec[{setup_key}] section is not of type configobj.Section")
-        
+        if variable_key in section:
+            raise KeyError('Duplicate key: %s' % variable_key)
+
         section[variable_key] = specification
 
     def get_setup_variable(self, setup_key: str, variable_key: str) -> Any:
@@ -412,7 +498,7 @@ class ConfigHelper(ConfigObj):
         object
             the value of the variable
         """
-        section = self.setup[setup_key] # type: ignore
+        section = self._setup[setup_key] # type: ignore
         if not isinstance(section, configobj.Section):
             raise TypeError(f"setup[{setup_key}] section is not of type configobj.Section")
         
@@ -438,15 +524,16 @@ class ConfigHelper(ConfigObj):
 
         """
         # Raise ValidationError
-        setupspecsection = self.setupspec[setup_key] # type: ignore
+        setupspecsection = self._setupspec.get(setup_key)
         if not isinstance(setupspecsection, configobj.Section):
             raise TypeError(f"setupspec[{setup_key}] section is not of type configobj.Section")
         value = self.validator.check(setupspecsection[variable_key], value)
         
-        setupsection = self.setup[setup_key] # type: ignore
+        setupsection = self._setup[setup_key] # type: ignore
         if not isinstance(setupsection, configobj.Section):
             raise TypeError(f"setup[{setup_key}] section is not of type configobj.Section")
         setupsection[variable_key] = value
+        self._dirty = True
 
     def needs_setup(self, key: str) -> bool:
         """
@@ -468,7 +555,7 @@ class ConfigHelper(ConfigObj):
         bool
             True if setup needs to be performed
         """
-        return key in self.setup
+        return key in self._setup
 
     def is_setup(self, variable: str) -> bool:
         """
@@ -484,7 +571,7 @@ class ConfigHelper(ConfigObj):
         bool
             True if setup is performed
         """
-        section = self.setup[variable] # type: ignore
+        section = self._setup[variable] # type: ignore
         if not isinstance(section, configobj.Section):
             raise TypeError(f"setup[{variable}] section is not of type configobj.Section")
         
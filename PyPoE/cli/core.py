@@ -73,7 +73,7 @@ def run(parser: argparse.ArgumentParser, config: ConfigHelper):
     It will take care of handling parsing the arguments and calling the
     appropriate function and print any tracebacks that occurred during the call.
 
-    Saves config and exits the python client.
+    Saves config if it was modified and exits the python client.
 
     .. warning::
         This function will exist the python client on completion
@@ -96,7 +96,8 @@ def run(parser: argparse.ArgumentParser, config: ConfigHelper):
         parser.print_help()
         code = 0
 
-    config.validate(config.validator)
-    config.write()
+    if config.dirty:
+        config.validate(config.validator)
+        config.write()
     sys.exit(code)
 
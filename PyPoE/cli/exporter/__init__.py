@@ -39,7 +39,7 @@ from colorama import init
 # self
 from PyPoE import APP_DIR
 from PyPoE.cli.config import ConfigHelper
-from PyPoE.cli.message import OutputHook
+from PyPoE.cli.message import _COLOR, OutputHook
 
 # =============================================================================
 # Globals
@@ -55,5 +55,8 @@ config = ConfigHelper(CONFIG_PATH)
 # Init
 # =============================================================================
 
-init()
+# No colour codes are written when the output is redirected, so there is
+# nothing for colorama to convert or strip
+if _COLOR:
+    init()
 OutputHook(warnings.showwarning)
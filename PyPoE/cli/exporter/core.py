@@ -44,6 +44,8 @@ Documentation
 
 # Python
 import argparse
+import os
+import sys
 
 # 3rd party
 
@@ -53,9 +55,16 @@ from PyPoE.poe.constants import VERSION, DISTRIBUTOR
 from PyPoE.cli.core import run
 from PyPoE.cli.handler import ConfigHandler, SetupHandler
 from PyPoE.cli.exporter import config
-from PyPoE.cli.exporter.dat import DatHandler
 from PyPoE.cli.exporter.wiki.core import WikiHandler
 
+# =============================================================================
+# Globals
+# =============================================================================
+
+# Commands that don't need the dat exporter. It registers no config options,
+# so it can be skipped entirely for them
+_NO_DAT_COMMANDS = frozenset(('config', 'setup', 'wiki'))
+
 # =============================================================================
 # Classes
 # =============================================================================
@@ -87,6 +96,8 @@ def setup_config():
                       'option("English", "French", "German", "Portuguese",'
                       '"Russian", "Spanish", "Thai", "Simplified Chinese",'
                       '"Traditional Chinese", "Korean", default="English")')
+    config.add_option('dat_read_threads', 'integer(min=1, default=%s)' %
+                      min(32, (os.cpu_count() or 1) * 4))
 
 
 def main():
@@ -99,7 +110,11 @@ def main():
 
     setup_config()
 
-    DatHandler(main_sub)
+    # Dispatch on the command before argparse; the full parser is only built
+    # for the dat exporter, the help output or unknown commands
+    if len(sys.argv) < 2 or sys.argv[1] not in _NO_DAT_COMMANDS:
+        from PyPoE.cli.exporter.dat import DatHandler
+        DatHandler(main_sub)
     WikiHandler(main_sub)
     # In that order..
     SetupHandler(main_sub, config)
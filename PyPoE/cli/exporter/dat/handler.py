@@ -30,10 +30,12 @@ See PyPoE/LICENSE
 # =============================================================================
 
 # Python
-
-# 3rd-party
 from argparse import ArgumentParser
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
+# 3rd-party
 from tqdm import tqdm
 
 # self
@@ -87,23 +89,19 @@ class DatExportHandler:
 
         spec = dat.default_spec
         if args.files is None:
-            args.files = list(spec)
+            args.files = sorted(spec)
         else:
             files: set[str] = set()
 
             for file_name in args.files:
-                if file_name in spec:
-                    files.add(file_name)
-                elif not file_name.endswith('.dat'):
+                if not file_name.endswith('.dat'):
                     file_name += '.dat'
-                    if file_name not in spec:
-                        console('.dat file "%s" is not in specification. Removing.' % file_name, msg=Msg.error)
-                    else:
-                        files.add(file_name)
+                if file_name in spec:
+                    files.add(sys.intern(file_name))
+                else:
+                    console('.dat file "%s" is not in specification. Removing.' % file_name, msg=Msg.error)
 
-            files_list = list(files)
-            files_list.sort()
-            args.files = files_list
+            args.files = sorted(files)
 
         args.spec = spec
 
@@ -118,28 +116,42 @@ class DatExportHandler:
 
         dat_files:dict[str, dat.DatFile] = {}
         lang = args.language or config.get_option('language')
-        dir_path = "Data/"
-        if lang != 'English':
-            #ggpk_data = index.get_dir_record("Data/%s" % lang)
-            dir_path = "Data/%s/" % lang
-        remove: list[str] = []
-        for name in tqdm(args.files):
-            file_path = dir_path + name + '64'
-            try:
-                data = file_system.get_file(file_path)
-            except FileNotFoundError:
-                console('Skipping "%s" (missing)' % file_path, msg=Msg.warning)
-                remove.append(name)
-                continue
-
-            df = dat.DatFile(name)
-
-            df.read(file_path_or_raw=data, use_dat_value=False, x64=True)
+        dir_path = 'Data/' if lang == 'English' else f'Data/{lang}/'
+        remove: set[str] = set()
+        get_file = file_system.get_file
+        DatFile = dat.DatFile
+        warning = Msg.warning
+        # Fetching (and decompressing) the files is done in worker threads,
+        # parsing happens here in order while the remaining files load
+        with ThreadPoolExecutor(
+                max_workers=config.get_option('dat_read_threads')) as executor:
+            submit = executor.submit
+            futures = []
+            for name in args.files:
+                file_path = f'{dir_path}{name}64'
+                futures.append((name, file_path, submit(get_file, file_path)))
 
-            dat_files[name] = df
-
-        for file_name in remove:
-            args.files.remove(file_name)
+            try:
+                for name, file_path, future in tqdm(futures):
+                    try:
+                        data = future.result()
+                    except FileNotFoundError:
+                        console('Skipping "%s" (missing)' % file_path, msg=warning)
+                        remove.add(name)
+                        continue
+
+                    df = DatFile(name)
+
+                    df.read(file_path_or_raw=data, use_dat_value=False, x64=True)
+
+                    dat_files[name] = df
+            except BaseException:
+                # Don't wait for all the pending files before failing
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        if remove:
+            args.files = [name for name in args.files if name not in remove]
 
         return dat_files
 
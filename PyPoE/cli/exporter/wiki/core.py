@@ -30,6 +30,7 @@ See PyPoE/LICENSE
 # =============================================================================
 
 # Python
+import sys
 
 # self
 from argparse import _SubParsersAction, ArgumentParser # pyright: ignore [reportPrivateUsage]
@@ -37,8 +38,6 @@ from typing import Any
 from PyPoE.cli.message import console, Msg
 from PyPoE.cli.handler import BaseHandler
 from PyPoE.cli.exporter import config
-from PyPoE.cli.exporter.wiki.parsers import WIKI_HANDLERS
-from PyPoE.cli.exporter.wiki.admin import ADMIN_HANDLERS
 
 # =============================================================================
 # Globals
@@ -64,13 +63,33 @@ class WikiHandler(BaseHandler):
         # Parser
         self.parser = sub_parser.add_parser('wiki', help='Wiki Exporter')
         self.parser.set_defaults(func=lambda: self.parser.print_help())
-        wiki_sub = self.parser.add_subparsers()
+        self._wiki_sub = self.parser.add_subparsers()
+        self._handlers_loaded = False
+
+        # Importing the exporters dominates the start up time, so they are only
+        # loaded when a wiki command is actually run
+        if sys.argv[1:2] == ['wiki']:
+            self.load_handlers()
+
+    def load_handlers(self) -> None:
+        """
+        Imports the wiki and admin exporters and registers their sub parsers.
+
+        Only needs to be called when the handler is used outside of the
+        exporter command line; repeated calls have no effect.
+        """
+        if self._handlers_loaded:
+            return
+        self._handlers_loaded = True
+
+        from PyPoE.cli.exporter.wiki.parsers import WIKI_HANDLERS
+        from PyPoE.cli.exporter.wiki.admin import ADMIN_HANDLERS
 
         for handler in WIKI_HANDLERS:
-            handler(wiki_sub)
+            handler(self._wiki_sub)
 
         for handler in ADMIN_HANDLERS:
-            handler(wiki_sub)
+            handler(self._wiki_sub)
 
     def _ver_dist_changed(self, key: str, value: Any, old_value: Any) -> None:
         if value == old_value:
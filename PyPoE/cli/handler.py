@@ -42,7 +42,7 @@ Documentation
 from argparse import _SubParsersAction, ArgumentParser # pyright: ignore [reportPrivateUsage]
 import argparse
 import traceback
-from typing import Any
+from typing import Any, Callable
 import configobj
 
 
@@ -61,6 +61,8 @@ __all__ = [
     'BaseHandler', 'ConfigHandler', 'SetupHandler',
 ]
 
+_SEPS = {char: char*70 for char in '-=*'}
+
 # =============================================================================
 # Classes
 # =============================================================================
@@ -84,7 +86,7 @@ class BaseHandler:
         return -1
 
     def print_sep(self, char: str='-') -> None:
-        console(char*70)
+        console(_SEPS.get(char) or char*70, raw=True)
 
 
 class ConfigHandler(BaseHandler):
@@ -114,6 +116,8 @@ class ConfigHandler(BaseHandler):
         self.config = config
         if not self.config.validate(config.validator):
             raise ConfigError('Config validation failed.')
+        # All options are registered by the time this handler is created
+        self._spec_set = frozenset(config.optionspec)
 
         # Parsing stuff
         self.parser = sub_parser.add_parser('config', help='Edit config options')
@@ -134,7 +138,7 @@ class ConfigHandler(BaseHandler):
 
         get_parser = config_sub.add_parser('get', help='Get config option')
         get_parser.set_defaults(func=self.get)
-        keys: list[Any] = config.optionspec.keys()
+        keys = tuple(config.optionspec)
         get_parser.add_argument(
             'variable',
             choices=keys,
@@ -143,7 +147,6 @@ class ConfigHandler(BaseHandler):
 
         set_parser = config_sub.add_parser('set', help='Set config option')
         set_parser.set_defaults(func=self.set)
-        keys = config.optionspec.keys()
         set_parser.add_argument(
             'variable',
             choices=keys,
@@ -186,32 +189,27 @@ class ConfigHandler(BaseHandler):
         int
             success code
         """
-        optionspec_keys: list[Any] = self.config.optionspec.keys()
-        spec = set(optionspec_keys)
-        
-        option_keys: list[Any] = self.config.option.keys()
-        real = set(option_keys)
-
-
-        missing = spec.difference(real)
-        extra = real.difference(spec)
-        configured = spec.difference(missing)
+        spec = self._spec_set
+        real = set(self.config.option)
 
+        missing = spec - real
+        extra = real - spec
+        configured = spec & real
 
         console('Current stored config variables:')
-        for key in sorted(list(configured)):
+        for key in sorted(configured):
             console("%s: %s" % (key, self.config.option[key]))
 
         if missing:
             console('', raw=True)
             console('Missing config variables (require config set):', msg=Msg.error)
-            for key in sorted(list(missing)):
+            for key in sorted(missing):
                 console("%s" % (key, ), Msg.error)
 
         if extra:
             console('', raw=True)
             console('Extra variables (unused):', msg=Msg.warning)
-            for key in sorted(list(extra)):
+            for key in sorted(extra):
                 console("%s: %s" % (key, self.config.option[key]), msg=Msg.warning)
 
         return 0
@@ -292,6 +290,27 @@ class SetupHandler(BaseHandler):
         )
         setup_perform.set_defaults(func=self.setup)
 
+        # All setups are registered by the time this handler is created, so
+        # the section structure is only checked once
+        setup_section = self.config['Setup'] # type: ignore
+        if not isinstance(setup_section, configobj.Section):
+            raise TypeError("config option section is not of type configobj.Section")
+
+        self._setup_entries: list[tuple[str, configobj.Section, tuple[Callable[[Any], Any], ...]]] = []
+        for key in setup_section: # type: ignore
+            if not isinstance(key, str):
+                raise TypeError("key is not of type str")
+
+            key_section = setup_section[key] # type: ignore
+            if not isinstance(key_section, configobj.Section):
+                raise TypeError("config option section is not of type configobj.Section")
+
+            # Left over from a setup that is no longer registered
+            funcs = self.config.setupFunctions.get(key)
+            if funcs is None:
+                continue
+            self._setup_entries.append((key, key_section, funcs))
+
     def setup(self, args: argparse.Namespace) -> int:
         """
         Performs the setup (if needed)
@@ -309,29 +328,18 @@ class SetupHandler(BaseHandler):
         console('Performing setup. This may take a while - please wait...')
         self.print_sep()
 
-        setup_section = self.config['Setup'] # type: ignore
-        if not isinstance(setup_section, configobj.Section):
-            raise TypeError("config option section is not of type configobj.Section")
-        
-        for key in setup_section: # type: ignore
-            if not isinstance(key, str):
-                raise TypeError("key is not of type str")
-            
-            key_section = setup_section[key] # type: ignore
-            if not isinstance(key_section, configobj.Section):
-                raise TypeError("config option section is not of type configobj.Section")
-            
+        for key, key_section, funcs in self._setup_entries:
             if key_section['performed']:
                 continue
             console('Performing setup for: %s' % key)
             try:
-                for func in self.config.setupFunctions[key]:
+                for func in funcs:
                     func(args)
             except Exception:
                 console('Unexpected error occured during setup:\n')
                 console(traceback.format_exc(), msg=Msg.error)
                 continue
-            key_section['performed'] = True
+            self.config.set_setup_variable(key, 'performed', True)
             self.print_sep()
         console('Done.')
         return 0
\ No newline at end of file
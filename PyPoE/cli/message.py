@@ -50,10 +50,11 @@ Functions
 # =============================================================================
 
 # Python
+import sys
 from typing import Any, Callable, TextIO, Type
 import warnings
 from enum import Enum
-from time import strftime
+from time import strftime, time
 
 # 3rd Party
 from colorama import Style, Fore
@@ -98,14 +99,7 @@ class OutputHook:
         warnings.showwarning = self.show_warning
 
     def format_warning(self, message: Warning | str, category: Type[Warning], filename: str, lineno: int, line: str | None = None):
-        kwargs = {
-            'message': message,
-            'category': category.__name__,
-            'filename': filename,
-            'lineno': lineno,
-            'line': line,
-        }
-        f = "%(filename)s:%(lineno)s:\n%(category)s: %(message)s\n" % kwargs
+        f = f"{filename}:{lineno}:\n{category.__name__}: {message}\n"
         return console(f, msg=Msg.warning, rtr=True)
     #
     def show_warning(self, *args: Any, **kwargs: Any) -> None:
@@ -115,6 +109,29 @@ class OutputHook:
 # Functions
 # =============================================================================
 
+# Colour codes are only useful when writing to a terminal
+_COLOR = sys.stdout is not None and sys.stdout.isatty()
+if _COLOR:
+    _PREFIX = {m: m.value for m in Msg}
+    _RESET = Msg.default.value
+else:
+    _PREFIX = {m: '' for m in Msg}
+    _RESET = ''
+
+# strftime is only called again once the second changed
+_last_time = -1
+_last_timestamp = ''
+
+
+def _timestamp() -> str:
+    global _last_time, _last_timestamp
+    now = int(time())
+    if now != _last_time:
+        _last_timestamp = strftime('%X')
+        _last_time = now
+    return _last_timestamp
+
+
 def console(message: str, msg: Msg = Msg.default, rtr: bool = False, raw: bool = False) -> str | None:
     """
     Send the specified messge to console
@@ -138,9 +155,9 @@ def console(message: str, msg: Msg = Msg.default, rtr: bool = False, raw: bool =
     if raw:
         f = message
     else:
-        f = msg.value + strftime('%X ') + message + Msg.default.value
+        f = f'{_PREFIX[msg]}{_timestamp()} {message}{_RESET}'
     if rtr:
         return f
     else:
-        print(f)
+        sys.stdout.write(f + '\n')
 
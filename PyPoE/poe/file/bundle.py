@@ -60,6 +60,7 @@ Index Records
 # python
 import struct
 import os
+import threading
 from enum import IntEnum
 from io import BytesIO
 from tempfile import TemporaryDirectory
@@ -230,9 +231,9 @@ class BundleRecord(IndexRecord):
     contents : Bundle
     BYTES : int
     """
-    __slots__ = ['parent', 'name', 'size',  'contents', 'BYTES']
+    __slots__ = ['parent', 'name', 'size',  'contents', 'BYTES', '_lock']
 
-    _REPR_EXTRA_ATTRIBUTES = {x: None for x in __slots__}
+    _REPR_EXTRA_ATTRIBUTES = {x: None for x in __slots__ if x != '_lock'}
 
     def __init__(self, raw: bytes, parent: 'Index', offset: int):
         self.parent: Index = parent
@@ -248,6 +249,7 @@ class BundleRecord(IndexRecord):
         self.BYTES: int = name_length + 8
 
         self.contents: Union[Bundle, None] = None
+        self._lock = threading.Lock()
 
     @property
     def file_name(self) -> str:
@@ -271,15 +273,21 @@ class BundleRecord(IndexRecord):
         """
         Reads the contents of this bundle if they haven't been read already
 
+        This is safe to call from multiple threads; the contents are only
+        published once they have been fully decompressed.
+
         Parameters
         ----------
         file_path_or_raw
             see Bundle.read
         """
         if self.contents is None:
-            self.contents = Bundle()
-            self.contents.read(file_path_or_raw)
-            self.contents.decompress()
+            with self._lock:
+                if self.contents is None:
+                    contents = Bundle()
+                    contents.read(file_path_or_raw)
+                    contents.decompress()
+                    self.contents = contents
 
 
 class FileRecord(IndexRecord):
@@ -52,13 +52,20 @@ Internal API
 # =============================================================================
 
 # Python
+import codecs
 import socket
 import select
 import struct
 import io
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
 from urllib import request
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit, quote
 from collections import OrderedDict
 from hashlib import sha256
 from hmac import compare_digest
@@ -76,6 +83,11 @@ from PyPoE.shared.murmur2 import murmur2_32
 
 __all__ = []
 
+# unknown byte, 33 blank bytes, length of the first url in characters
+_PATCH_URLS_HEADER = struct.Struct('<B33sB')
+# The urls are sent as little endian UTF-16 without BOM
+_decode_utf16le = codecs.lookup('utf-16-le').decode
+
 # =============================================================================
 # Functions
 # =============================================================================
@@ -532,6 +544,9 @@ class Patch:
         Load-balanced patching url including port for the current PoE version.
     sock_fd : fd
         Socket file descriptor for connection to patch server
+
+    The connection is closed by :meth:`close`, which is also called when the
+    instance is used as a context manager.
     """
 
     _SERVER_IPV4 = '172.65.204.172'
@@ -539,6 +554,10 @@ class Patch:
     _PORT = 12995
     # use patch proto 4
     _PROTO = b'\x01\x04'
+    # Seconds to wait for the master server before giving up
+    _TIMEOUT = 5.0
+    # (family, address) per resolved (master_server, master_port)
+    _resolved = {}
 
     def __init__(self, master_server=_SERVER_IPV4, master_port=_PORT):
         """
@@ -557,55 +576,153 @@ class Patch:
             Port to use when connecting to the master patching server
         """
         self._master_server = (master_server, master_port)
+        # HTTP connections are kept alive and reused per thread; they are
+        # tracked for all threads so they can be closed from any thread
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        # Requests through a proxy are left to urllib, like redirects
+        self._proxies = request.getproxies()
+        self._created_dirs = set()
+        self._sock = None
         self.update_patch_urls()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __del__(self):
         """
         Automatically close the patchserver connection and socket.
         """
+        # __init__ may have failed before the socket was created
+        if hasattr(self, '_sock'):
+            self.close()
 
-        sock = socket_fd_open(self.sock_fd)
-        try:
-            sock.shutdown(socket.SHUT_RDWR)
-        except OSError:
-            pass
-        try:
+    def close(self):
+        """
+        Shutdown and close the patchserver connection and all HTTP
+        connections.
+        """
+        sock = self._sock
+        if sock is not None:
+            self._sock = None
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             sock.close()
-        except OSError:
-            raise
+
+        self._close_connections()
+
+    def _close_connections(self, thread_ids=None):
+        """
+        Closes the HTTP connections of the threads with the given identifiers
+        or of all threads if thread_ids is None.
+        """
+        with self._connections_lock:
+            if thread_ids is None:
+                thread_ids = list(self._connections)
+            for thread_id in thread_ids:
+                connections = self._connections.pop(thread_id, None)
+                if connections is not None:
+                    for connection in connections.values():
+                        connection.close()
+
+    @property
+    def sock_fd(self):
+        """
+        File descriptor of the socket connected to the patchserver.
+
+        Returns
+        -------
+        int
+            The file descriptor, -1 if the connection was closed
+        """
+        if self._sock is None:
+            return -1
+        return self._sock.fileno()
 
     def update_patch_urls(self):
         """
         Updates the patch urls from the master server.
 
-        Open a connection to the patchserver, get webroot details,
-        detach from socket, and store socket file descriptor as :attr:`sock_fd`
+        Open a connection to the patchserver, get webroot details and keep
+        the connection open; its file descriptor is available as
+        :attr:`sock_fd`.
 
         .. note::
 
-            Recreate socket object later with: :func:`.socket_fd_open`
+            Create another socket object for the connection with:
+            :func:`.socket_fd_open`
 
-            When finished, destroy socket with: :func:`.socket_fd_close`.
-            Equivalent is called in :meth:`.__del__`
+            When finished, close the connection with :meth:`close`.
+            It is called automatically when leaving the context manager or
+            in :meth:`.__del__`
         """
-        with socket.socket(proto=socket.IPPROTO_TCP) as sock:
-            sock.connect(self._master_server)
+        self.close()
+        family, address = self._resolve()
+        sock = socket.socket(family, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        try:
+            # The request is tiny, don't let Nagle hold it back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.settimeout(Patch._TIMEOUT)
+            sock.connect(address)
             sock.send(Patch._PROTO)
-            data = io.BytesIO(sock.recv(1024))
-
-            unknown = struct.unpack('B', data.read(1))[0]
-            blank = struct.unpack('33s', data.read(33))[0]
-
-            url_length = struct.unpack('B', data.read(1))[0]
-            self.patch_url = data.read(url_length*2).decode('utf-16')
-
-            blank = struct.unpack('B', data.read(1))[0]
+            data = bytearray()
+
+            def recv_until(length):
+                # The response may arrive in multiple segments. Never read past
+                # it, anything after belongs to later queries on this socket
+                while len(data) < length:
+                    received = sock.recv(length - len(data))
+                    if not received:
+                        raise EOFError('Reached end of TCP stream'
+                                       + ' when expecting more data')
+                    data.extend(received)
+
+            recv_until(_PATCH_URLS_HEADER.size)
+            unknown, blank, url_length = _PATCH_URLS_HEADER.unpack_from(data)
+
+            offset = _PATCH_URLS_HEADER.size
+            end = offset + url_length*2
+            # url, blank byte, length of the second url
+            recv_until(end + 2)
+            self.patch_url = _decode_utf16le(memoryview(data)[offset:end])[0]
+
+            url2_length = data[end + 1]
+            offset = end + 2
+            end = offset + url2_length*2
+            recv_until(end)
+            self.patch_cdn_url = _decode_utf16le(memoryview(data)[offset:end])[0]
+
+            self._version = self.patch_url.strip('/').rsplit('/', maxsplit=1)[-1]
+            # Hosts to download from in order of preference, pre-split
+            self._hosts = tuple(
+                (host, urlsplit(host)) for host in (self.patch_url, )
+            )
+            # Users of sock_fd expect a blocking socket
+            sock.settimeout(None)
+        except BaseException:
+            sock.close()
+            raise
 
-            url2_length = struct.unpack('B', data.read(1))[0]
-            self.patch_cdn_url = data.read(url2_length*2).decode('utf-16')
+        self._sock = sock
 
-            # Close this later!
-            self.sock_fd = sock.detach()
+    def _resolve(self):
+        """
+        Returns the socket family and address of the master server, resolving
+        it only once per process.
+        """
+        resolved = Patch._resolved.get(self._master_server)
+        if resolved is None:
+            family, _, _, _, address = socket.getaddrinfo(
+                *self._master_server,
+                type=socket.SOCK_STREAM, proto=socket.IPPROTO_TCP,
+            )[0]
+            resolved = Patch._resolved[self._master_server] = (family, address)
+        return resolved
 
     def download(self, file_path, dst_dir=None, dst_file=None):
         """
@@ -649,11 +766,15 @@ class Patch:
             raise ValueError('Either dst_dir or dst_file must be set')
 
         # Make any intermediate dirs to avoid errors
-        os.makedirs(os.path.split(write_path)[0], exist_ok=True)
+        dir_path = os.path.dirname(write_path)
+        if dir_path and dir_path not in self._created_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._created_dirs.add(dir_path)
 
-        # As per manual, writing should automatically find the optimal buffer
-        with open(write_path, mode='wb') as f:
-            f.write(self.download_raw(file_path))
+        # Stream the response to disk instead of buffering it in memory
+        with self._open_response(file_path) as response, \
+                open(write_path, mode='wb') as f:
+            shutil.copyfileobj(response, f, 2**16)
 
     def download_raw(self, file_path):
         """
@@ -671,23 +792,165 @@ class Patch:
 
         Raises
         ------
+        urllib.error.HTTPError
+            if the server responded with a HTTP error code
         ValueError
-            if the HTTP status code is not 200 (and it wasn't raised by urllib)
+            if the HTTP status code is not 200
+        """
+        with self._open_response(file_path) as response:
+            return response.read()
+
+    def download_many(self, file_paths, dst_dir, max_workers=8):
+        """
+        Downloads multiple files from the patching server concurrently.
+
+        Each worker thread reuses a single keep-alive connection to the
+        patching server for all of its downloads; the connections are closed
+        once all files are downloaded.
+
+        Parameters
+        ----------
+        file_paths : Iterable[str]
+            paths of the files relative to the content.ggpk root directory
+        dst_dir : str
+            Write the files to the specified directory, see :meth:`download`
+        max_workers : int
+            Maximum number of files to download at the same time
+
+        Raises
+        ------
+        urllib.error.HTTPError
+            if the server responded with a HTTP error code for any of the files
+        ValueError
+            if the HTTP status code is not 200 for any of the files
+        """
+        # Other threads may use the same Patch instance, so only the
+        # connections of the workers are closed afterwards
+        worker_ids = set()
+
+        def download(file_path):
+            worker_ids.add(threading.get_ident())
+            self.download(file_path, dst_dir=dst_dir)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for _ in executor.map(download, file_paths):
+                    pass
+        finally:
+            self._close_connections(worker_ids)
+
+    def _get_connection(self, scheme, netloc):
+        """
+        Returns the keep-alive connection of the current thread to the given
+        host, creating it if needed.
+        """
+        thread_id = threading.get_ident()
+        connections = self._connections.get(thread_id)
+        if connections is None:
+            with self._connections_lock:
+                connections = self._connections[thread_id] = {}
+
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            if scheme == 'https':
+                connection = HTTPSConnection(netloc)
+            else:
+                connection = HTTPConnection(netloc)
+            connections[(scheme, netloc)] = connection
+
+        return connection
+
+    @contextmanager
+    def _open_response(self, file_path):
         """
-        hosts = [self.patch_url]
-        for index, host in enumerate(hosts):
+        Context manager that opens the response for the specified file.
+
+        The body must be read entirely within the context, otherwise the
+        connection is discarded.
+        """
+        hosts = self._hosts
+        for index, (host, url) in enumerate(hosts):
             try:
-                with request.urlopen(
-                    url="%s%s" % (host, file_path),
-                ) as robj:
-                    if robj.getcode() != 200:
-                        raise ValueError('HTTP response code: %s' % robj.getcode())
-                    return robj.read()
-            except URLError as url_error:
+                connection, response = self._request(host, url, file_path)
+            except ConnectionRefusedError:
                 # try alternate patch url if connection refused
-                if (not isinstance(url_error.reason, ConnectionRefusedError)
-                    or not index < len(hosts)):
-                    raise url_error
+                if index + 1 >= len(hosts):
+                    raise
+                continue
+
+            if connection is None:
+                with response:
+                    yield response
+                return
+
+            try:
+                yield response
+            except BaseException:
+                # Unread data would be left on the socket
+                connection.close()
+                raise
+            return
+
+    def _request(self, host, url, file_path):
+        """
+        Performs a GET request for the file at the given host and returns the
+        connection and the successful response.
+
+        Requests through a proxy and redirects are handled by urllib instead,
+        in that case the returned connection is None.
+        """
+        path = url.path + quote(file_path)
+        if url.scheme in self._proxies and \
+                not request.proxy_bypass(url.hostname):
+            return None, self._urlopen(url, path)
+
+        connection = self._get_connection(url.scheme, url.netloc)
+        try:
+            connection.request('GET', path)
+            response = connection.getresponse()
+        except (HTTPException, ConnectionResetError, BrokenPipeError):
+            # The server may have closed the kept-alive connection, retry once
+            # with a fresh connection
+            connection.close()
+            connection.request('GET', path)
+            response = connection.getresponse()
+
+        if response.status != 200:
+            # Read the entire body, so the connection can be reused
+            response.read()
+            if response.status >= 400:
+                raise HTTPError(
+                    host + file_path, response.status, response.reason,
+                    response.headers, None,
+                )
+            if 300 <= response.status < 400:
+                return None, self._urlopen(url, path)
+            raise ValueError('HTTP response code: %s' % response.status)
+
+        return connection, response
+
+    def _urlopen(self, url, path):
+        """
+        Performs a GET request for the path with urllib and returns the
+        successful response.
+        """
+        try:
+            response = request.urlopen(
+                '%s://%s%s' % (url.scheme, url.netloc, path)
+            )
+        except HTTPError:
+            raise
+        except URLError as url_error:
+            # Allow the caller to try the alternate patch url
+            if isinstance(url_error.reason, ConnectionRefusedError):
+                raise url_error.reason from url_error
+            raise
+
+        if response.status != 200:
+            response.close()
+            raise ValueError('HTTP response code: %s' % response.status)
+
+        return response
 
     @property
     def version(self):
@@ -702,7 +965,7 @@ class Patch:
             The first 3 digits match the public known versions, the last is
             internal scheme for the a/b/c patches and hotfixes.
         """
-        return self.patch_url.strip('/').rsplit('/', maxsplit=1)[-1]
+        return self._version
 
 class PatchFileList:
     """
@@ -830,7 +1093,7 @@ class PatchFileList:
         """
         # Want patch server details from Patch instance
         self.patch = patch
-        # Want socket fd details from Patch instance
+        # Own socket object for the connection of the Patch instance
         self.sock = socket_fd_open(patch.sock_fd)
         self.sock_timeout = socket_timeout
         self.data = bytes
@@ -842,9 +1105,12 @@ class PatchFileList:
 
     def __del__(self):
         """
-        Detach socket on instance deletion
+        Close the socket on instance deletion
+
+        The connection itself stays open until the :class:`.Patch` instance
+        is closed.
         """
-        self.patch.sock_fd = self.sock.detach()
+        self.sock.close()
 
     def read(self, read_length):
         """
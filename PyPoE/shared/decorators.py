@@ -31,6 +31,7 @@ See PyPoE/LICENSE
 
 # Python
 import functools
+import sys
 import warnings
 
 # 3rd-party
@@ -41,7 +42,7 @@ import warnings
 # Globals
 # =============================================================================
 
-__all__ = ['deprecated', 'doc']
+__all__ = ['deprecated', 'deprecated_default', 'doc', 'get_doc']
 
 
 # =============================================================================
@@ -57,11 +58,14 @@ class DeprecationDecorator:
     function call and also adds the DEPRECATED
 
     """
+    __slots__ = ('message', 'doc_message', 'version', 'once', '_doc')
+
     _default_message = 'Use of {func} is deprecated and will be removed in' \
                        ' PyPoE {version}'
     _default_doc_message = 'DEPRECATED. Will be removed in PyPoE {version}'
 
-    def __init__(self, message=None, doc_message=None, version=None):
+    def __init__(self, message=None, doc_message=None, version=None,
+                 once=True):
         """
         Settings for the decorator.
 
@@ -79,35 +83,58 @@ class DeprecationDecorator:
         :param str message: Warning message on each call.
         :param str doc_message: Message to append to docstring
         :param str version: Version the function will be removed in
+        :param bool once: Only warn on the first call of the function instead
+            of on each call
         """
         self.message = message or self._default_message
         self.doc_message = doc_message or self._default_doc_message
         self.version = version or 'unknown version'
+        # The same versions and messages are usually passed many times
+        if isinstance(self.version, str):
+            self.version = sys.intern(self.version)
+        if isinstance(self.message, str):
+            self.message = sys.intern(self.message)
+        self.once = once
+        # Only depends on the version, shared by all decorated functions
+        self._doc = self.doc_message.format(version=self.version)
 
     def __call__(self, function):
-        message_kwargs = {
-            'version': self.version,
-        }
-
-        if hasattr(function, '__func__'):
-            function = function.__func__
-
-        if function.__doc__ is None:
-            function.__doc__ = self.doc_message.format(**message_kwargs)
+        function = getattr(function, '__func__', function)
+
+        # The full doc string is assembled by get_doc; it is only written to
+        # __doc__ right away unless running optimized
+        function._pypoe_deprecated_doc = (self._doc, function.__doc__)
+        if __debug__:
+            function.__doc__ = get_doc(function)
+
+        # Neither the function nor the settings change after decoration
+        warn_msg = self.message.format(
+            func=function.__name__,
+            version=self.version,
+        )
+        # Everything the wrapper needs is bound as keyword only default, so
+        # these keyword arguments can't be passed to the wrapped function
+        if self.once:
+            emitted = False
+
+            def deprecated_function(*args, _warn=warnings.warn,
+                                    _cat=DeprecationWarning, _msg=warn_msg,
+                                    _fn=function, **kwargs):
+                nonlocal emitted
+                if not emitted:
+                    emitted = True
+                    _warn(_msg, _cat, stacklevel=2)
+
+                return _fn(*args, **kwargs)
         else:
-            function.__doc__ = self.doc_message.format(**message_kwargs) + \
-                               '\n' + function.__doc__
+            def deprecated_function(*args, _warn=warnings.warn,
+                                    _cat=DeprecationWarning, _msg=warn_msg,
+                                    _fn=function, **kwargs):
+                _warn(_msg, _cat, stacklevel=2)
 
-        @functools.wraps(function)
-        def deprecated_function(*args, **kwargs):
-            warnings.warn(
-                self.message.format(
-                    func=function.__name__,
-                    **message_kwargs
-                ), DeprecationWarning, stacklevel=2,
-            )
+                return _fn(*args, **kwargs)
 
-            return function(*args, **kwargs)
+        _update_wrapper(deprecated_function, function)
 
         return deprecated_function
 
@@ -119,6 +146,7 @@ class DocStringDecorator:
     It will modify the doc string of a given object, but will not actually
     wrap it. This is done so it can work with any type of object.
     """
+    __slots__ = ('append', 'prepend', 'doc', '_docs')
 
     def __init__(self, prepend=None, append=None, doc=None):
         """
@@ -137,6 +165,8 @@ class DocStringDecorator:
         self.append = self._get_str(append)
         self.prepend = self._get_str(prepend)
         self.doc = doc
+        # Assembled doc string if it doesn't depend on the decorated object
+        self._docs = None
 
     def _get_str(self, obj):
         if obj is None:
@@ -148,19 +178,27 @@ class DocStringDecorator:
         else:
             return ''
 
+    def _assemble(self, docs):
+        if not self.prepend and not self.append:
+            return docs
+        return ''.join((self.prepend, docs, self.append))
+
     def __call__(self, object):
         if self.doc is None:
-            docs = self._get_str(object)
+            docs = self._assemble(self._get_str(object))
         else:
-            docs = self._get_str(self.doc)
-
-        docs = self.prepend + docs + self.append
+            docs = self._docs
+            if docs is None:
+                docs = self._docs = self._assemble(self._get_str(self.doc))
 
         if docs != '':
-            if hasattr(object, '__func__'):
-                object.__func__.__doc__ = docs
-            else:
-                object.__doc__ = docs
+            target = getattr(object, '__func__', object)
+            if getattr(target, '__doc__', None) != docs:
+                try:
+                    target.__doc__ = docs
+                except (AttributeError, TypeError):
+                    # Builtins and other objects with a read-only doc string
+                    pass
 
         return object
 
@@ -170,14 +208,68 @@ class DocStringDecorator:
 # =============================================================================
 
 
+def _update_wrapper(wrapper, wrapped):
+    """
+    Lighter :func:`functools.update_wrapper` that only copies the attributes
+    needed for introspection and documentation.
+    """
+    wrapper.__module__ = wrapped.__module__
+    wrapper.__name__ = wrapped.__name__
+    wrapper.__qualname__ = wrapped.__qualname__
+    wrapper.__doc__ = wrapped.__doc__
+    wrapper.__wrapped__ = wrapped
+    return wrapper
+
+
+def get_doc(obj):
+    """
+    Returns the doc string of the given object including the deprecation note
+    of :func:`deprecated`, if the object was decorated with it.
+
+    :param obj: Function, method or wrapper returned by :func:`deprecated`
+
+    :return: The doc string
+    :rtype: str or None
+    """
+    obj = getattr(obj, '__func__', obj)
+    obj = getattr(obj, '__wrapped__', obj)
+    # Only the object's own marker, subclasses of a deprecated class don't
+    # inherit the note
+    deprecated_doc = getattr(obj, '__dict__', {}).get('_pypoe_deprecated_doc')
+    if deprecated_doc is None:
+        return obj.__doc__
+
+    note, doc = deprecated_doc
+    if doc is None:
+        return note
+    return note + '\n' + doc
+
+
+@functools.cache
 def _make_callable(cls):
-    @functools.wraps(cls)
+    """
+    Creates a decorator factory for the given decorator class.
+
+    The factory can be used directly as decorator (``@decorator``), in which
+    case the pre-built instance with the default settings that is available
+    as ``default`` attribute of the factory is applied, or be called with
+    the settings for the decorator class (``@decorator(...)``).
+
+    The factory is only created once per class.
+    """
+    # Decorators don't change after creation, so the bare @decorator form can
+    # share one instance with the default settings
+    default = cls()
+
     def call(*args, **kwargs):
         if len(args) == 1 and callable(args[0]):
-            return cls()(args[0])
+            return default(args[0])
         else:
             return cls(*args, **kwargs)
 
+    _update_wrapper(call, cls)
+    call.default = default
+
     return call
 
 
@@ -186,4 +278,5 @@ def _make_callable(cls):
 # =============================================================================
 
 deprecated = _make_callable(DeprecationDecorator)
+deprecated_default = deprecated.default
 doc = _make_callable(DocStringDecorator)
@@ -0,0 +1,136 @@
+"""
+Tests for PyPoE.cli.exporter.dat.handler
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/cli/exporter/dat/test_dat_handler.py                 |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                                                             |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import argparse
+import threading
+import time
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.cli.config import ConfigHelper
+from PyPoE.cli.exporter.dat import handler
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+
+class FileSystem:
+    threads = set()
+    calls = 0
+    delay = 0
+
+    def __init__(self, root_path):
+        pass
+
+    def get_file(self, path):
+        FileSystem.threads.add(threading.get_ident())
+        FileSystem.calls += 1
+        time.sleep(FileSystem.delay)
+        if 'Missing' in path:
+            raise FileNotFoundError(path)
+        return path.encode()
+
+
+class DatFile:
+    def __init__(self, name):
+        self.name = name
+
+    def read(self, file_path_or_raw, **kwargs):
+        if self.name == 'Broken.dat':
+            raise ValueError(self.name)
+        self.raw = file_path_or_raw
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def dat_handler(monkeypatch, tmpdir):
+    config = ConfigHelper(infile=str(tmpdir.join('config.conf')))
+    config.add_option('language', 'string(default="English")')
+    config.add_option('dat_read_threads', 'integer(min=1, default=2)')
+    config.validate(config.validator)
+
+    FileSystem.threads = set()
+    FileSystem.calls = 0
+    FileSystem.delay = 0
+
+    monkeypatch.setattr(handler, 'config', config)
+    monkeypatch.setattr(handler, 'get_content_path', lambda: str(tmpdir))
+    monkeypatch.setattr(handler, 'FileSystem', FileSystem)
+    monkeypatch.setattr(handler.dat, 'DatFile', DatFile)
+
+    return handler.DatExportHandler()
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestReadDatFiles:
+    def test_read(self, dat_handler):
+        names = ['B.dat', 'Missing.dat', 'A.dat'] + \
+            ['C%s.dat' % i for i in range(20)]
+        args = argparse.Namespace(files=list(names), language=None)
+
+        dat_files = dat_handler._read_dat_files(args)
+
+        names.remove('Missing.dat')
+        assert list(dat_files) == names
+        assert args.files == names
+        assert dat_files['A.dat'].raw == b'Data/A.dat64'
+        # Files are fetched by the worker threads only
+        assert threading.get_ident() not in FileSystem.threads
+        assert len(FileSystem.threads) <= 2
+
+    def test_language(self, dat_handler):
+        args = argparse.Namespace(files=['A.dat'], language='German')
+
+        dat_files = dat_handler._read_dat_files(args)
+
+        assert dat_files['A.dat'].raw == b'Data/German/A.dat64'
+
+    def test_error_cancels_pending(self, dat_handler):
+        FileSystem.delay = 0.01
+        args = argparse.Namespace(
+            files=['Broken.dat'] + ['C%s.dat' % i for i in range(200)],
+            language=None,
+        )
+
+        with pytest.raises(ValueError):
+            dat_handler._read_dat_files(args)
+
+        assert FileSystem.calls < 20
@@ -0,0 +1,163 @@
+"""
+Tests for PyPoE.cli.config
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/cli/test_config.py                                   |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                                                             |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.cli.config import ConfigHelper
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def config(tmpdir):
+    return ConfigHelper(infile=str(tmpdir.join('config.conf')))
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestOption:
+    def test_validator_lazy(self, config):
+        config.add_option('number', 'integer(default=1)')
+        config.register_setup('number', lambda args: None)
+        config.add_setup_variable('number', 'hash', 'string(default="")')
+        assert 'validator' not in vars(config)
+
+        config.option['number'] = '5'
+        assert config.get_option('number', safe=False) == 5
+        assert 'validator' in vars(config)
+
+    def test_get_option_cached(self, config):
+        config.add_option('number', 'integer(default=1)')
+        config.option['number'] = '5'
+
+        assert config.get_option('number') == 5
+        assert config.get_option('number') == 5
+
+        config.option['number'] = '6'
+        assert config.get_option('number') == 6
+
+    def test_get_option_mutable_result(self, config):
+        config.add_option('items', 'force_list(default=list())')
+        config.option['items'] = 'a'
+
+        value = config.get_option('items')
+        assert value == ['a']
+        value.append('b')
+
+        assert config.get_option('items') == ['a']
+
+    def test_set_option_default_value(self, config, tmpdir):
+        config.add_option('language', 'string(default="English")')
+        config.validate(config.validator)
+        assert 'language' in config.option.defaults
+
+        config.set_option('language', 'English')
+        assert config.dirty
+        config.write()
+
+        assert 'language = English' in tmpdir.join('config.conf').read()
+
+    def test_set_option_unchanged(self, config):
+        config.add_option('language', 'string(default="English")')
+        config.set_option('language', 'German')
+        config.write()
+
+        config.set_option('language', 'German')
+        assert not config.dirty
+
+    def test_dirty(self, config):
+        config.add_option('number', 'integer(default=1)')
+        config.register_setup('number', lambda args: None)
+        config.add_setup_variable('number', 'hash', 'string(default="")')
+        assert not config.dirty
+
+        config.set_option('number', '2')
+        assert config.dirty
+        config.write()
+        assert not config.dirty
+
+        config.set_setup_variable('number', 'hash', 'abc')
+        assert config.dirty
+        config.write()
+        assert not config.dirty
+
+
+class TestSetup:
+    def test_register_setups_generator(self, config):
+        def a(args):
+            pass
+
+        def b(args):
+            pass
+
+        config.register_setups((key, (a, b)) for key in ('one', 'two'))
+
+        for key in ('one', 'two'):
+            assert config.setupFunctions[key] == (a, b)
+            assert config.setup[key]['performed'] is False
+            assert config.setupspec[key]['performed'] == 'boolean()'
+
+    def test_register_setups_function_generator(self, config):
+        def a(args):
+            pass
+
+        config.register_setups([('one', (f for f in (a, a)))])
+
+        assert config.setupFunctions['one'] == (a, a)
+
+    def test_register_setups_iterable_callable(self, config):
+        class Setup:
+            def __call__(self, args):
+                pass
+
+            def __iter__(self):
+                return iter(())
+
+        setup = Setup()
+        config.register_setups([('one', setup)])
+
+        assert config.setupFunctions['one'] == (setup, )
+
+    @pytest.mark.parametrize('funcs', [None, 1, [1], [print, 'a']])
+    def test_register_setups_not_callable(self, config, funcs):
+        with pytest.raises(TypeError):
+            config.register_setups([('one', print), ('two', funcs)])
+
+        assert 'one' not in config.setup
+        assert 'one' not in config.setupFunctions
@@ -0,0 +1,85 @@
+"""
+Tests for PyPoE.poe.file.bundle
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/poe/file/test_bundle.py                              |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                                                             |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 3rd-party
+
+# self
+from PyPoE.poe.file import bundle
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+
+class Bundle:
+    instances = 0
+
+    def __init__(self):
+        Bundle.instances += 1
+
+    def read(self, file_path_or_raw):
+        # Give other threads the chance to race for the contents
+        time.sleep(0.05)
+
+    def decompress(self):
+        pass
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestBundleRecord:
+    def test_read_once_threaded(self, monkeypatch):
+        monkeypatch.setattr(bundle, 'Bundle', Bundle)
+        Bundle.instances = 0
+        name = b'Data/Mods.dat'
+        raw = struct.pack('<I', len(name)) + name + struct.pack('<I', 100)
+        record = bundle.BundleRecord(raw, None, 0)
+
+        barrier = threading.Barrier(8)
+
+        def read():
+            barrier.wait()
+            record.read(b'')
+            return record.contents
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: read(), range(8)))
+
+        assert Bundle.instances == 1
+        assert all(result is results[0] for result in results)
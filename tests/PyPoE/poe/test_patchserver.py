@@ -37,8 +37,12 @@ candidate for testing.
 
 # Python
 import os
+import threading
 import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import request
 from urllib.error import HTTPError
+from urllib.parse import urlsplit
 from socket import socket
 
 # 3rd-party
@@ -53,7 +57,7 @@ from PyPoE.poe.file import ggpk
 # =============================================================================
 
 _TEST_FILE = 'Bundles/Startup_x64.bundle.txt'
-_re_version = re.compile(r'[\d]+\.[\d]+\.[\d]+\.[\d]+', re.UNICODE)
+_re_version = re.compile(r'\d+\.\d+\.\d+\.\d+', re.ASCII)
 
 def get_node_folders(file):
     dir_paths = []
@@ -76,7 +80,8 @@ _TEST_NODE_PATHS = get_node_folders(_TEST_FILE)
 
 @pytest.fixture(scope='module')
 def patch():
-    return patchserver.Patch()
+    with patchserver.Patch() as patch:
+        yield patch
 
 @pytest.fixture(scope='module')
 def temp(tmpdir_factory):
@@ -85,12 +90,58 @@ def temp(tmpdir_factory):
 
 @pytest.fixture(scope='function')
 def patch_temp():
-    return patchserver.Patch()
+    with patchserver.Patch() as patch:
+        yield patch
 
 @pytest.fixture(scope='module')
 def patch_file_list(patch):
     return patchserver.PatchFileList(patch)
 
+class LocalHandler(BaseHTTPRequestHandler):
+    """
+    Answers with the requested path, paths below /redirect/ are redirected
+    to the same path below /files/.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith('/redirect/'):
+            self.send_response(302)
+            self.send_header(
+                'Location', '/files/' + self.path[len('/redirect/'):]
+            )
+            body = b''
+        else:
+            self.send_response(200)
+            body = self.path.encode()
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture(scope='function')
+def local_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LocalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:%s/' % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(scope='function')
+def local_patch(monkeypatch, local_url):
+    def update_patch_urls(self):
+        self.patch_url = self.patch_cdn_url = local_url + 'files/'
+        self._hosts = ((self.patch_url, urlsplit(self.patch_url)), )
+
+    monkeypatch.setattr(patchserver.Patch, 'update_patch_urls',
+                        update_patch_urls)
+    monkeypatch.setattr(request, 'getproxies', dict)
+    with patchserver.Patch() as patch:
+        yield patch
+
 # =============================================================================
 # Tests
 # =============================================================================
@@ -128,10 +179,55 @@ class TestPatch:
                 file_path='THIS_SHOULD_NOT_EXIST.FILE',
             )
 
+    def test_download_many(self, patch, tmpdir):
+        patch.download_many([_TEST_FILE], dst_dir=str(tmpdir))
+        assert os.path.exists(os.path.join(str(tmpdir), _TEST_FILE))
+        # Connections of the worker threads are closed once done
+        assert set(patch._connections) <= {threading.get_ident()}
+
+    def test_close(self):
+        with patchserver.Patch() as patch:
+            assert patch.sock_fd >= 0
+        assert patch.sock_fd == -1
+        # Closing again is a no-op
+        patch.close()
+
     def test_version(self, patch):
-        assert _re_version.match(patch.version) is not None, 'patch.version ' \
+        assert _re_version.fullmatch(patch.version) is not None, 'patch.version ' \
             'result is expected to match the x.x.x.x format'
 
+class TestPatchLocal:
+    def test_download_raw(self, local_patch):
+        assert local_patch.download_raw('a.txt') == b'/files/a.txt'
+
+    def test_redirect(self, local_patch, local_url):
+        url = local_url + 'redirect/'
+        local_patch._hosts = ((url, urlsplit(url)), )
+        assert local_patch.download_raw('a.txt') == b'/files/a.txt'
+
+    def test_download_many_other_thread(self, local_patch, tmpdir):
+        downloaded = threading.Event()
+        done = threading.Event()
+
+        def download():
+            local_patch.download_raw('a.txt')
+            downloaded.set()
+            done.wait()
+
+        thread = threading.Thread(target=download)
+        thread.start()
+        try:
+            downloaded.wait()
+            local_patch.download_many(['a.txt', 'b.txt'], dst_dir=str(tmpdir))
+            # Only the connections of the workers are closed
+            assert set(local_patch._connections) == {thread.ident}
+        finally:
+            done.set()
+            thread.join()
+
+        with open(os.path.join(str(tmpdir), 'b.txt'), 'rb') as f:
+            assert f.read() == b'/files/b.txt'
+
 @pytest.mark.dependency(depends=["test_socket"])
 class TestPatchFileList:
     @pytest.mark.dependency()
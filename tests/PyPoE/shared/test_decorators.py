@@ -116,6 +116,54 @@ class TestDeprecated:
     def test_empty_args(self, callobj, obj):
         self.run_test(decorators.deprecated(), callobj, obj)
 
+    @pytest.mark.parametrize('callobj,obj', make_objects())
+    def test_default_instance(self, callobj, obj):
+        assert decorators.deprecated.default is decorators.deprecated_default
+        self.run_test(decorators.deprecated_default, callobj, obj)
+
+    @pytest.mark.parametrize('callobj,obj', make_objects())
+    def test_default_message(self, callobj, obj):
+        deco = decorators.deprecated(version='1.0')
+        name = getattr(callobj, '__func__', callobj).__name__
+
+        for warn in self.run_test(deco, callobj, obj):
+            assert warn.message.args[0] == 'Use of %s is deprecated and will ' \
+                'be removed in PyPoE 1.0' % name
+
+    def test_default_message_subclass(self):
+        class Decorator(decorators.DeprecationDecorator):
+            __slots__ = ()
+            _default_message = 'Custom {func} {version}'
+
+        def function():
+            pass
+
+        o = Decorator(version='1.0')(function)
+        with pytest.warns(DeprecationWarning) as record:
+            o()
+
+        assert record[0].message.args[0] == 'Custom function 1.0'
+
+    @pytest.mark.parametrize('once,count', [(True, 1), (False, 3)])
+    def test_once_arg(self, once, count):
+        o = decorators.deprecated(once=once)(lambda: None)
+
+        with pytest.warns(DeprecationWarning) as record:
+            for i in range(3):
+                o()
+
+        assert len(record) == count
+
+    @pytest.mark.parametrize('callobj,obj', make_objects())
+    def test_wrapper_attributes(self, callobj, obj):
+        function = getattr(callobj, '__func__', callobj)
+        o = decorators.deprecated(callobj)
+
+        assert o.__wrapped__ is function
+        assert o.__name__ == function.__name__
+        assert o.__qualname__ == function.__qualname__
+        assert o.__doc__ == function.__doc__
+
     @pytest.mark.parametrize('callobj,obj', make_objects())
     def test_message_arg(self, callobj, obj):
         deco = decorators.deprecated(message='Test')
@@ -130,6 +178,40 @@ class TestDeprecated:
         self.run_test(deco, callobj, obj)
         assert callobj.__doc__.startswith('Test')
 
+    @pytest.mark.parametrize('callobj,obj', make_objects())
+    def test_get_doc(self, callobj, obj):
+        function = getattr(callobj, '__func__', callobj)
+        doc = function.__doc__
+        o = decorators.deprecated(doc_message='Test')(callobj)
+
+        expected = 'Test' if doc is None else 'Test\n' + doc
+        assert decorators.get_doc(o) == expected
+        assert decorators.get_doc(callobj) == expected
+
+    def test_get_doc_subclass(self):
+        class A:
+            """A doc"""
+
+        decorators.deprecated(A)
+
+        class B(A):
+            """B doc"""
+
+        class C(A):
+            pass
+
+        assert decorators.get_doc(A).startswith('DEPRECATED.')
+        assert decorators.get_doc(B) == 'B doc'
+        assert decorators.get_doc(C) is None
+
+
+
+def test_make_callable_cached():
+    assert decorators._make_callable(decorators.DeprecationDecorator) is \
+        decorators.deprecated
+    assert decorators._make_callable(decorators.DocStringDecorator) is \
+        decorators.doc
+
 
 class TestDoc:
     """Test"""
@@ -164,4 +246,13 @@ class TestDoc:
     def test_arg_doc_with_obj(self, callobj, obj):
         o = decorators.doc(doc=TestDoc)(callobj)
 
-        assert o.__doc__ == 'Test'
\ No newline at end of file
+        assert o.__doc__ == 'Test'
+
+    def test_reused_instance(self):
+        deco = decorators.doc(doc=TestDoc, append='Append')
+
+        for callobj, obj in make_objects(True):
+            assert deco(callobj).__doc__ == 'TestAppend'
+
+    def test_read_only_doc(self):
+        assert decorators.doc(doc='Test')(len) is len